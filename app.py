@@ -1,7 +1,10 @@
-import math
-from datetime import datetime
+import time
+from collections import deque
+import pandas as pd
 import streamlit as st
 
+from calculator import BATCH_TABLE, CATEGORIES, OPS, HistEntry, compute, compute_batch, format_number, parse_batch
+
 # -----------------------------
 # Page config
 # -----------------------------
@@ -14,34 +17,22 @@ st.set_page_config(
 # -----------------------------
 # Helpers & State
 # -----------------------------
-def init_state():
-    if "history" not in st.session_state:
-        st.session_state.history = []  # list of dicts: {time, op, inputs, result, error}
-
-def format_number(x, precision):
-    if isinstance(x, (int,)):
-        return str(x)
-    try:
-        return f"{x:.{precision}f}"
-    except Exception:
-        return str(x)
-
-def to_radians(x, angle_mode):
-    return math.radians(x) if angle_mode == "Degrees" else x
+HISTORY_MAXLEN = 500
 
-def from_radians(x, angle_mode):
-    return math.degrees(x) if angle_mode == "Degrees" else x
+def format_inputs(inputs):
+    return ", ".join(f"{k}={v}" for k, v in inputs.items() if v is not None)
 
 def add_history(op, inputs, result=None, error=None):
-    st.session_state.history.append({
-        "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "operation": op,
-        "inputs": inputs,
-        "result": result,
-        "error": error
-    })
+    st.session_state.history.append(HistEntry(
+        time=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+        operation=op,
+        inputs=inputs,
+        result=result,
+        error=error,
+    ))
 
-init_state()
+# HistEntry records; oldest entries drop off past HISTORY_MAXLEN
+st.session_state.setdefault("history", deque(maxlen=HISTORY_MAXLEN))
 
 # -----------------------------
 # Sidebar controls
@@ -54,18 +45,22 @@ with st.sidebar:
     st.markdown("### 🧠 Memory")
     colA, colB = st.columns(2)
     if colA.button("Clear history", use_container_width=True):
-        st.session_state.history = []
+        st.session_state.history.clear()
         st.success("History cleared.")
     if colB.button("Copy last result", use_container_width=True):
         if st.session_state.history:
             last = st.session_state.history[-1]
-            if last.get("error") is None and last.get("result") is not None:
-                st.code(str(last["result"]), language="text")
+            if last.error is None and last.result is not None:
+                try:
+                    st.code(str(last.result), language="text")
+                except ValueError:
+                    # ints past Python's str() digit limit
+                    st.info(f"Result too large to copy: {format_number(last.result, precision)}")
             else:
                 st.info("Last entry has no result to copy.")
         else:
             st.info("No history yet.")
-    st.caption("History persists for the session.")
+    st.caption(f"History persists for the session (last {HISTORY_MAXLEN} entries).")
 
 # -----------------------------
 # Header
@@ -78,25 +73,20 @@ st.caption("Make your daily calculations easy")
 # -----------------------------
 tab_calc, tab_history = st.tabs(["Calculator", "History"])
 
-with tab_calc:
+# Each tab is a fragment, so interacting with its widgets reruns only that tab
+@st.fragment
+def _calc_fragment(angle_mode, precision):
     st.subheader("Select Operation")
 
     # Operation groups
     group = st.selectbox(
         "Category",
-        ["Basic", "Advanced", "Trigonometry", "Inverse Trig", "Misc"],
+        CATEGORIES,
         index=0
     )
 
     # Dynamic operation selection
-    ops = {
-        "Basic": ["Add", "Subtract", "Multiply", "Divide"],
-        "Advanced": ["Power (x^y)", "Square Root", "Exponential (e^x)", "Natural Log (ln)", "Log Base 10", "Log (Custom Base)"],
-        "Trigonometry": ["sin", "cos", "tan"],
-        "Inverse Trig": ["arcsin", "arccos", "arctan"],
-        "Misc": ["Absolute", "Factorial", "Percentage (x of y)"]
-    }
-    op = st.selectbox("Operation", ops[group])
+    op = st.selectbox("Operation", OPS[group])
 
     # -----------------------------
     # Inputs per operation
@@ -146,76 +136,14 @@ with tab_calc:
         result = None
         error = None
         try:
-            if group == "Basic":
-                if op == "Add":
-                    result = x + y
-                elif op == "Subtract":
-                    result = x - y
-                elif op == "Multiply":
-                    result = x * y
-                elif op == "Divide":
-                    if y == 0:
-                        raise ZeroDivisionError("Division by zero is undefined.")
-                    result = x / y
-
-            elif group == "Advanced":
-                if op == "Power (x^y)":
-                    result = math.pow(x, y)
-                elif op == "Square Root":
-                    if x < 0:
-                        raise ValueError("Square root domain error: x must be ≥ 0.")
-                    result = math.sqrt(x)
-                elif op == "Exponential (e^x)":
-                    result = math.exp(x)
-                elif op == "Natural Log (ln)":
-                    if x <= 0:
-                        raise ValueError("Log domain error: x must be > 0.")
-                    result = math.log(x)
-                elif op == "Log Base 10":
-                    if x <= 0:
-                        raise ValueError("Log domain error: x must be > 0.")
-                    result = math.log10(x)
-                elif op == "Log (Custom Base)":
-                    if x <= 0 or base is None or base <= 0 or base == 1:
-                        raise ValueError("For log_b(x): x>0, b>0, b≠1.")
-                    result = math.log(x, base)
-
-            elif group == "Trigonometry":
-                r = to_radians(x, angle_mode)
-                if op == "sin":
-                    result = math.sin(r)
-                elif op == "cos":
-                    result = math.cos(r)
-                elif op == "tan":
-                    result = math.tan(r)
-
-            elif group == "Inverse Trig":
-                # Validate domain for inverse trig
-                if op in ["arcsin", "arccos"] and not (-1.0 <= x <= 1.0):
-                    raise ValueError("Domain error: input must be in [-1, 1].")
-                if op == "arcsin":
-                    result = from_radians(math.asin(x), angle_mode)
-                elif op == "arccos":
-                    result = from_radians(math.acos(x), angle_mode)
-                elif op == "arctan":
-                    result = from_radians(math.atan(x), angle_mode)
-
-            elif group == "Misc":
-                if op == "Absolute":
-                    result = abs(x)
-                elif op == "Factorial":
-                    if not (isinstance(x, int) and x >= 0):
-                        raise ValueError("Factorial requires a non-negative integer.")
-                    result = math.factorial(x)
-                elif op == "Percentage (x of y)":
-                    result = (x / 100.0) * y
+            result = compute(group, op, x=x, y=y, base=base, angle_mode=angle_mode)
 
             add_history(
                 op=f"{group} → {op}",
                 inputs={"x": x, "y": y, "base": base, "angle_mode": angle_mode},
                 result=result,
             )
-            st.success(f"Result: **{format_number(result, precision)}**")
+            st.session_state.last_message = ("success", f"Result: **{format_number(result, precision)}**")
 
         except Exception as e:
             error = str(e)
@@ -224,7 +152,40 @@ with tab_calc:
                 inputs={"x": x, "y": y, "base": base, "angle_mode": angle_mode},
                 error=error,
             )
-            st.error(f"Error: {error}")
+            st.session_state.last_message = ("error", f"Error: {error}")
+
+        # Full rerun so the History fragment picks up the new entry
+        st.rerun()
+
+    message = st.session_state.pop("last_message", None)
+    if message is not None:
+        kind, text = message
+        if kind == "success":
+            st.success(text)
+        else:
+            st.error(text)
+
+    # -----------------------------
+    # Batch evaluate
+    # -----------------------------
+    if (group, op) in BATCH_TABLE:
+        with st.expander("Batch evaluate"):
+            batch_text = st.text_area("Batch input (one number per line)")
+            if st.button("Evaluate batch", use_container_width=True):
+                if not batch_text.strip():
+                    st.info("Enter at least one number to evaluate.")
+                else:
+                    try:
+                        xs = parse_batch(batch_text)
+                        results = compute_batch(group, op, xs, y=y, base=base, angle_mode=angle_mode)
+                        st.dataframe(
+                            pd.DataFrame({"x": xs, "result": results}),
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={"result": st.column_config.NumberColumn(format=f"%.{precision}f")},
+                        )
+                    except Exception as e:
+                        st.error(f"Error: {e}")
 
    # Quick constants
    # st.divider()
@@ -234,19 +195,45 @@ with tab_calc:
    # c2.metric("e", "2.718281828459045")
    # c3.metric("τ (2π)", "6.283185307179586")
 
-with tab_history:
+@st.fragment
+def _history_fragment(precision):
     st.subheader("Calculation History (this session)")
     if st.session_state.history:
-        for item in reversed(st.session_state.history):
-            with st.expander(f"🕒 {item['time']} — {item['operation']}"):
-                st.write("**Inputs:**", item["inputs"])
-                if item.get("error"):
-                    st.error(item["error"])
-                else:
-                    st.write("**Result:**", item["result"])
+        # Newest first; one table widget regardless of how long the session gets
+        items = list(reversed(st.session_state.history))
+        df = pd.DataFrame({
+            "Time": [item.time for item in items],
+            "Operation": [item.operation for item in items],
+            "Inputs": [format_inputs(item.inputs) for item in items],
+            "Result": [
+                "" if item.error else format_number(item.result, precision)
+                for item in items
+            ],
+            "Error": [item.error or "" for item in items],
+        })
+        st.dataframe(df, use_container_width=True, hide_index=True)
+
+        # Drill-down into a single entry
+        idx = st.selectbox(
+            "Details",
+            range(len(items)),
+            format_func=lambda i: f"🕒 {items[i].time} — {items[i].operation}",
+        )
+        item = items[idx]
+        st.write("**Inputs:**", item.inputs)
+        if item.error:
+            st.error(item.error)
+        else:
+            st.write("**Result:**", format_number(item.result, precision))
     else:
         st.info("No calculations yet. Your results will appear here.")
 
+with tab_calc:
+    _calc_fragment(angle_mode, precision)
+
+with tab_history:
+    _history_fragment(precision)
+
 # -----------------------------
 # Footer
 # -----------------------------
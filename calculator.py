@@ -0,0 +1,245 @@
+import math
+from collections import namedtuple
+from functools import lru_cache, wraps
+
+import numpy as np
+
+try:
+    import gmpy2
+except ImportError:  # optional: binary-splitting factorial for large n
+    gmpy2 = None
+
+_fac = gmpy2.fac if gmpy2 is not None else math.factorial
+
+# Streamlit re-executes app.py on every interaction, but imported modules stay
+# cached in sys.modules, so everything below is built once per process.
+
+# -----------------------------
+# Helpers
+# -----------------------------
+# Integers longer than this are shown as leading…trailing digits; matches
+# Python's default str() limit, so anything str() can print is shown in full
+_MAX_DIGITS = 4300
+_EDGE_DIGITS = 20
+
+def _format_int(x):
+    n = abs(x)
+    if n < 10 ** _MAX_DIGITS:
+        return str(x)
+    # str() is quadratic and capped at 4300 digits, so count digits arithmetically
+    digits = int(math.log10(n)) + 1
+    if 10 ** (digits - 1) > n:
+        digits -= 1
+    elif 10 ** digits <= n:
+        digits += 1
+    head = n // 10 ** (digits - _EDGE_DIGITS)
+    tail = n % 10 ** _EDGE_DIGITS
+    sign = "-" if x < 0 else ""
+    return f"{sign}{head}…{tail:0{_EDGE_DIGITS}d} ({digits} digits)"
+
+@lru_cache(maxsize=256)
+def _format_float(x, precision):
+    return format(x, f".{precision}f")
+
+def format_number(x, precision):
+    # ints skip the cache: it is process-wide and would pin huge factorials
+    if x.__class__ is int:
+        return _format_int(x)
+    if x.__class__ is float:
+        # 0.0 and -0.0 share a cache key, so format zeros directly
+        if x == 0:
+            return format(x, f".{precision}f")
+        return _format_float(x, precision)
+    return str(x)
+
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+@lru_cache(maxsize=64)
+def _log_denom(base):
+    # log_b(x) = ln(x) / ln(b); ln(b) is reused while only x changes
+    return math.log(base)
+
+# -----------------------------
+# Memoized transcendental functions
+# -----------------------------
+# Reruns with unchanged inputs hit the cache instead of libm.
+def _memoize(fn):
+    cached = lru_cache(maxsize=1024)(fn)
+
+    @wraps(fn)
+    def wrapper(x, *args):
+        # 0.0 and -0.0 hash equal; bypass the cache so the sign survives
+        if x == 0:
+            return fn(x, *args)
+        return cached(x, *args)
+    return wrapper
+
+@_memoize
+def _sin(x, deg):
+    return math.sin(x * _DEG2RAD) if deg else math.sin(x)
+
+@_memoize
+def _cos(x, deg):
+    return math.cos(x * _DEG2RAD) if deg else math.cos(x)
+
+@_memoize
+def _tan(x, deg):
+    return math.tan(x * _DEG2RAD) if deg else math.tan(x)
+
+@_memoize
+def _asin(x, deg):
+    return math.asin(x) * _RAD2DEG if deg else math.asin(x)
+
+@_memoize
+def _acos(x, deg):
+    return math.acos(x) * _RAD2DEG if deg else math.acos(x)
+
+@_memoize
+def _atan(x, deg):
+    return math.atan(x) * _RAD2DEG if deg else math.atan(x)
+
+@_memoize
+def _exp(x):
+    return math.exp(x)
+
+@_memoize
+def _log(x):
+    return math.log(x)
+
+@_memoize
+def _log10(x):
+    return math.log10(x)
+
+# -----------------------------
+# History record
+# -----------------------------
+# Fixed-layout tuple instead of a dict per entry; defined here so the class
+# is not recreated on every app.py rerun.
+HistEntry = namedtuple("HistEntry", "time operation inputs result error")
+
+# -----------------------------
+# Operation menu
+# -----------------------------
+OPS = {
+    "Basic": ("Add", "Subtract", "Multiply", "Divide"),
+    "Advanced": ("Power (x^y)", "Square Root", "Exponential (e^x)", "Natural Log (ln)", "Log Base 10", "Log (Custom Base)"),
+    "Trigonometry": ("sin", "cos", "tan"),
+    "Inverse Trig": ("arcsin", "arccos", "arctan"),
+    "Misc": ("Absolute", "Factorial", "Percentage (x of y)")
+}
+CATEGORIES = tuple(OPS)
+
+# -----------------------------
+# Domain checks
+# -----------------------------
+def _check_divide(y, **_):
+    if y == 0:
+        raise ZeroDivisionError("Division by zero is undefined.")
+
+def _check_sqrt(x, **_):
+    if x < 0:
+        raise ValueError("Square root domain error: x must be ≥ 0.")
+
+def _check_log(x, **_):
+    if x <= 0:
+        raise ValueError("Log domain error: x must be > 0.")
+
+def _check_log_base(x, base, **_):
+    if x <= 0 or base is None or base <= 0 or base == 1:
+        raise ValueError("For log_b(x): x>0, b>0, b≠1.")
+
+def _check_base(base, **_):
+    if base is None or base <= 0 or base == 1:
+        raise ValueError("For log_b(x): b>0, b≠1.")
+
+def _check_unit_interval(x, **_):
+    if not (-1.0 <= x <= 1.0):
+        raise ValueError("Domain error: input must be in [-1, 1].")
+
+def _check_factorial(x, **_):
+    if not (isinstance(x, int) and x >= 0):
+        raise ValueError("Factorial requires a non-negative integer.")
+
+# (group, op) -> validator; ops without domain restrictions are absent
+OP_VALIDATE = {
+    ("Basic", "Divide"): _check_divide,
+    ("Advanced", "Square Root"): _check_sqrt,
+    ("Advanced", "Natural Log (ln)"): _check_log,
+    ("Advanced", "Log Base 10"): _check_log,
+    ("Advanced", "Log (Custom Base)"): _check_log_base,
+    ("Inverse Trig", "arcsin"): _check_unit_interval,
+    ("Inverse Trig", "arccos"): _check_unit_interval,
+    ("Misc", "Factorial"): _check_factorial,
+}
+
+# -----------------------------
+# Dispatch table
+# -----------------------------
+# (group, op) -> fn(x=..., y=..., base=..., angle_mode=...)
+OP_TABLE = {
+    ("Basic", "Add"): lambda x, y, **_: x + y,
+    ("Basic", "Subtract"): lambda x, y, **_: x - y,
+    ("Basic", "Multiply"): lambda x, y, **_: x * y,
+    ("Basic", "Divide"): lambda x, y, **_: x / y,
+    ("Advanced", "Power (x^y)"): lambda x, y, **_: math.pow(x, y),
+    ("Advanced", "Square Root"): lambda x, **_: math.sqrt(x),
+    ("Advanced", "Exponential (e^x)"): lambda x, **_: _exp(x),
+    ("Advanced", "Natural Log (ln)"): lambda x, **_: _log(x),
+    ("Advanced", "Log Base 10"): lambda x, **_: _log10(x),
+    ("Advanced", "Log (Custom Base)"): lambda x, base, **_: _log(x) / _log_denom(base),
+    ("Trigonometry", "sin"): lambda x, angle_mode, **_: _sin(x, angle_mode == "Degrees"),
+    ("Trigonometry", "cos"): lambda x, angle_mode, **_: _cos(x, angle_mode == "Degrees"),
+    ("Trigonometry", "tan"): lambda x, angle_mode, **_: _tan(x, angle_mode == "Degrees"),
+    ("Inverse Trig", "arcsin"): lambda x, angle_mode, **_: _asin(x, angle_mode == "Degrees"),
+    ("Inverse Trig", "arccos"): lambda x, angle_mode, **_: _acos(x, angle_mode == "Degrees"),
+    ("Inverse Trig", "arctan"): lambda x, angle_mode, **_: _atan(x, angle_mode == "Degrees"),
+    ("Misc", "Absolute"): lambda x, **_: abs(x),
+    ("Misc", "Factorial"): lambda x, **_: int(_fac(x)),
+    ("Misc", "Percentage (x of y)"): lambda x, y, **_: (x / 100.0) * y,
+}
+
+def compute(group, op, x=None, y=None, base=None, angle_mode="Degrees"):
+    key = (group, op)
+    check = OP_VALIDATE.get(key)
+    if check is not None:
+        check(x=x, y=y, base=base, angle_mode=angle_mode)
+    return OP_TABLE[key](x=x, y=y, base=base, angle_mode=angle_mode)
+
+# -----------------------------
+# Batch (vectorized) evaluation
+# -----------------------------
+# Only scalar parameters are checked; per-element domain errors become NaN
+BATCH_VALIDATE = {
+    ("Advanced", "Log (Custom Base)"): _check_base,
+}
+
+# (group, op) -> fn(x=ndarray, y=..., base=..., angle_mode=...); y and base
+# stay scalar. Out-of-domain elements come back as NaN instead of raising.
+BATCH_TABLE = {
+    ("Advanced", "Power (x^y)"): lambda x, y, **_: np.power(x, y),
+    ("Advanced", "Square Root"): lambda x, **_: np.sqrt(x),
+    ("Advanced", "Exponential (e^x)"): lambda x, **_: np.exp(x),
+    ("Advanced", "Natural Log (ln)"): lambda x, **_: np.log(x),
+    ("Advanced", "Log Base 10"): lambda x, **_: np.log10(x),
+    ("Advanced", "Log (Custom Base)"): lambda x, base, **_: np.log(x) / _log_denom(base),
+    ("Trigonometry", "sin"): lambda x, angle_mode, **_: np.sin(x * _DEG2RAD if angle_mode == "Degrees" else x),
+    ("Trigonometry", "cos"): lambda x, angle_mode, **_: np.cos(x * _DEG2RAD if angle_mode == "Degrees" else x),
+    ("Trigonometry", "tan"): lambda x, angle_mode, **_: np.tan(x * _DEG2RAD if angle_mode == "Degrees" else x),
+}
+
+def compute_batch(group, op, x, y=None, base=None, angle_mode="Degrees"):
+    key = (group, op)
+    check = BATCH_VALIDATE.get(key)
+    if check is not None:
+        check(x=x, y=y, base=base, angle_mode=angle_mode)
+    with np.errstate(all="ignore"):
+        return BATCH_TABLE[key](x=x, y=y, base=base, angle_mode=angle_mode)
+
+def parse_batch(text):
+    # one number per line; commas and blanks also separate values
+    tokens = text.replace(",", " ").split()
+    try:
+        return np.array(tokens, dtype=float)
+    except ValueError:
+        raise ValueError("Batch input must contain only numbers.") from None
@@ -0,0 +1,105 @@
+import math
+import re
+
+import numpy as np
+import pytest
+
+from calculator import (
+    OP_TABLE, OPS, _MAX_DIGITS, _format_int, compute, compute_batch, format_number, parse_batch,
+)
+
+
+def test_format_int_below_threshold_is_exact():
+    assert _format_int(10 ** (_MAX_DIGITS - 1)) == "1" + "0" * (_MAX_DIGITS - 1)
+    assert _format_int(10 ** _MAX_DIGITS - 1) == "9" * _MAX_DIGITS
+    assert _format_int(-(10 ** _MAX_DIGITS - 1)) == "-" + "9" * _MAX_DIGITS
+    # 1000! (2568 digits) is shown in full
+    assert _format_int(math.factorial(1000)) == str(math.factorial(1000))
+
+
+def test_format_int_at_threshold_is_abbreviated():
+    suffix = f" ({_MAX_DIGITS + 1} digits)"
+    assert _format_int(10 ** _MAX_DIGITS) == "1" + "0" * 19 + "…" + "0" * 20 + suffix
+    assert _format_int(-(10 ** _MAX_DIGITS)) == "-1" + "0" * 19 + "…" + "0" * 20 + suffix
+
+
+def test_format_int_past_str_digit_limit():
+    # 3000! has 9131 digits, over the 4300-digit str() limit
+    n = math.factorial(3000)
+    out = _format_int(n)
+    assert out.startswith("41493596034378540855…")
+    assert out.endswith("…" + "0" * 20 + " (9131 digits)")
+    assert _format_int(10 ** 5000 + 7) == "1" + "0" * 19 + "…" + "0" * 19 + "7 (5001 digits)"
+
+
+def test_format_number_keeps_int_and_float_apart():
+    assert format_number(1, 6) == "1"
+    assert format_number(1.0, 6) == "1.000000"
+
+
+def test_cached_results_keep_the_sign_of_zero():
+    for first, second in ((-0.0, 0.0), (0.0, -0.0)):
+        compute("Trigonometry", "sin", x=first, angle_mode="Radians")
+        result = compute("Trigonometry", "sin", x=second, angle_mode="Radians")
+        assert math.copysign(1.0, result) == math.copysign(1.0, second)
+        format_number(first, 6)
+        assert format_number(second, 6) == format(second, ".6f")
+
+
+def test_every_menu_operation_has_a_table_entry():
+    menu = {(group, op) for group, ops in OPS.items() for op in ops}
+    assert menu == set(OP_TABLE)
+
+
+@pytest.mark.parametrize("group, op, kwargs, exc, message", [
+    ("Basic", "Divide", {"x": 1.0, "y": 0.0}, ZeroDivisionError, "Division by zero is undefined."),
+    ("Advanced", "Square Root", {"x": -1.0}, ValueError, "Square root domain error: x must be ≥ 0."),
+    ("Advanced", "Natural Log (ln)", {"x": 0.0}, ValueError, "Log domain error: x must be > 0."),
+    ("Advanced", "Log Base 10", {"x": -1.0}, ValueError, "Log domain error: x must be > 0."),
+    ("Advanced", "Log (Custom Base)", {"x": 8.0, "base": 1.0}, ValueError, "For log_b(x): x>0, b>0, b≠1."),
+    ("Inverse Trig", "arcsin", {"x": 1.5}, ValueError, "Domain error: input must be in [-1, 1]."),
+    ("Inverse Trig", "arccos", {"x": -1.5}, ValueError, "Domain error: input must be in [-1, 1]."),
+    ("Misc", "Factorial", {"x": 5.0}, ValueError, "Factorial requires a non-negative integer."),
+])
+def test_domain_errors_keep_their_messages(group, op, kwargs, exc, message):
+    with pytest.raises(exc, match=re.escape(message)):
+        compute(group, op, **kwargs)
+
+
+@pytest.mark.parametrize("x", [-90.0, 30.0, 45.0, 123.4])
+def test_trig_matches_math_radians(x):
+    assert compute("Trigonometry", "sin", x=x) == math.sin(math.radians(x))
+    assert compute("Trigonometry", "cos", x=x) == math.cos(math.radians(x))
+    assert compute("Trigonometry", "tan", x=x) == math.tan(math.radians(x))
+    assert compute("Trigonometry", "sin", x=x, angle_mode="Radians") == math.sin(x)
+
+
+@pytest.mark.parametrize("x", [-1.0, -0.5, 0.25, 1.0])
+def test_inverse_trig_matches_math_degrees(x):
+    assert compute("Inverse Trig", "arcsin", x=x) == math.degrees(math.asin(x))
+    assert compute("Inverse Trig", "arccos", x=x) == math.degrees(math.acos(x))
+    assert compute("Inverse Trig", "arctan", x=x) == math.degrees(math.atan(x))
+    assert compute("Inverse Trig", "arctan", x=x, angle_mode="Radians") == math.atan(x)
+
+
+def test_batch_out_of_domain_elements_are_nan():
+    xs = parse_batch("4\n-1\n0")
+    roots = compute_batch("Advanced", "Square Root", xs)
+    assert roots[0] == 2.0 and np.isnan(roots[1]) and roots[2] == 0.0
+    logs = compute_batch("Advanced", "Natural Log (ln)", xs)
+    assert logs[0] == math.log(4.0) and np.isnan(logs[1]) and logs[2] == -np.inf
+
+
+def test_batch_rejects_invalid_log_base():
+    with pytest.raises(ValueError, match=re.escape("For log_b(x): b>0, b≠1.")):
+        compute_batch("Advanced", "Log (Custom Base)", parse_batch("8"), base=1.0)
+
+
+def test_parse_batch_rejects_non_numbers():
+    with pytest.raises(ValueError, match="Batch input must contain only numbers."):
+        parse_batch("1\ntwo\n3")
+
+
+def test_parse_batch_accepts_commas_and_blank_input():
+    assert parse_batch("1, 2\n3").tolist() == [1.0, 2.0, 3.0]
+    assert parse_batch("  \n\t ").size == 0